@@ -0,0 +1,164 @@
+"""Structured JSON access log, written off the event loop in batches.
+
+``AccessLogMiddleware`` records one dict per request and hands it to
+``AccessLogWriter`` via a bounded queue. A background thread serialises the
+records and writes them to stdout (picked up by awslogs / Railway) in
+batches, so request handling never waits on log I/O. When the queue is full
+records are dropped rather than blocking; the writer reports how many as a
+``{"dropped": n}`` line.
+"""
+
+import json
+import queue
+import random
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+
+from app.api.content import content_version
+from app.config import settings
+
+_STOP = object()
+
+
+class AccessLogWriter:
+    def __init__(
+        self,
+        stream=None,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        max_queue: int = 10_000,
+    ):
+        self.stream = stream
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        # Only the writer thread touches this; ``dropped`` only grows, so the
+        # two counters never race.
+        self._reported_dropped = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="access-log", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self):
+        """Flush everything queued so far and stop the writer thread."""
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join()
+            self._thread = None
+
+    def emit(self, record: dict):
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self):
+        stream = self.stream or sys.stdout
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while batch[-1] is not _STOP and len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+
+            stopping = batch[-1] is _STOP
+            lines = [
+                json.dumps(record, separators=(",", ":"))
+                for record in batch
+                if record is not _STOP
+            ]
+            pending_dropped = self.dropped - self._reported_dropped
+            if pending_dropped:
+                self._reported_dropped += pending_dropped
+                lines.append(json.dumps({"ts": _now(), "dropped": pending_dropped}))
+            if lines:
+                stream.write("\n".join(lines) + "\n")
+                stream.flush()
+            if stopping:
+                return
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+
+
+access_log_writer = AccessLogWriter(
+    batch_size=settings.ACCESS_LOG_BATCH_SIZE,
+    flush_interval=settings.ACCESS_LOG_FLUSH_INTERVAL,
+)
+
+
+class AccessLogMiddleware:
+    """Pure ASGI middleware so response bodies are counted, not buffered."""
+
+    def __init__(self, app, writer: AccessLogWriter = access_log_writer):
+        self.app = app
+        self.writer = writer
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = 500
+        size = 0
+
+        async def send_wrapper(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self._log(scope, status, size, time.perf_counter() - start)
+
+    def _log(self, scope, status, size, elapsed):
+        path = scope["path"]
+        if (
+            status < 400
+            and path.startswith("/static/")
+            and random.random() >= settings.ACCESS_LOG_STATIC_SAMPLE_RATE
+        ):
+            return
+
+        route = getattr(scope.get("route"), "path", None)
+        # Only conditional requests can hit a cache here: StaticFiles answers
+        # 304 when the client's copy is current. Other routes are uncached.
+        if status == 304:
+            cache = "revalidated"
+        elif path.startswith("/static/"):
+            cache = "miss"
+        else:
+            cache = None
+
+        self.writer.emit(
+            {
+                "ts": _now(),
+                "method": scope["method"],
+                "path": path,
+                "route": route,
+                "status": status,
+                "latency_ms": round(elapsed * 1000, 2),
+                "bytes": size,
+                "cache": cache,
+                "content_version": content_version(),
+            }
+        )
@@ -1,10 +1,17 @@
+import hashlib
 import json
 from functools import lru_cache
 from pathlib import Path
 
 import markdown
 
-from app.config import CONTENT_DIR
+from app.config import BASE_DIR, CONTENT_DIR
+
+# Code that shapes the cached section payloads: response models and markdown
+# rendering in app/api, and the section list/renderers in main.js.
+_PAYLOAD_CODE = sorted((BASE_DIR / "app" / "api").glob("*.py")) + [
+    BASE_DIR / "static" / "js" / "main.js",
+]
 
 
 @lru_cache
@@ -18,3 +25,18 @@ def load_markdown_as_html(filename: str) -> str:
     path = CONTENT_DIR / filename
     md_text = path.read_text(encoding="utf-8").strip()
     return markdown.markdown(md_text)
+
+
+@lru_cache
+def content_version() -> str:
+    """Hash of content/ and the code that shapes it, for client-side caching.
+
+    Only file names and bytes go in, so every task running the same build
+    reports the same version.
+    """
+    digest = hashlib.sha256()
+    content_files = [p for p in sorted(CONTENT_DIR.iterdir()) if p.is_file()]
+    for path in content_files + _PAYLOAD_CODE:
+        digest.update(path.relative_to(BASE_DIR).as_posix().encode("utf-8") + b"\0")
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Response
+from pydantic import BaseModel
+
+from app.api.content import content_version
+
+router = APIRouter(prefix="/api", tags=["content"])
+
+
+class ContentVersionResponse(BaseModel):
+    version: str
+
+
+@router.get("/content-version", response_model=ContentVersionResponse)
+async def get_content_version(response: Response):
+    version = content_version()
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Content-Version"] = version
+    return {"version": version}
@@ -5,14 +5,15 @@ import re
 import unicodedata
 from pathlib import Path
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from fastapi.responses import StreamingResponse
 from fpdf import FPDF
 
 from app.api.content import load_json
 from app.config import CONTENT_DIR
+from app.rate_limit import cv_rate_limit
 
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(cv_rate_limit)])
 
 # ── Text sanitiser (Helvetica = Latin-1 only) ────────────────────────────────
 
@@ -0,0 +1,66 @@
+"""Admin endpoints for listing and downloading captured request profiles."""
+
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+from app.config import settings
+from app.profiling import get_dump, list_dumps, token_matches
+
+
+def require_profile_token(x_profile_token: str | None = Header(default=None)):
+    if not settings.PROFILE_TOKEN:
+        raise HTTPException(status_code=404)
+    if not token_matches(x_profile_token):
+        raise HTTPException(status_code=403)
+
+
+router = APIRouter(
+    prefix="/api/admin/profiles",
+    tags=["admin"],
+    dependencies=[Depends(require_profile_token)],
+    include_in_schema=False,
+)
+
+
+class ProfileSummary(BaseModel):
+    id: int
+    method: str
+    path: str
+    status_code: int
+    duration_ms: float
+    captured_at: datetime
+    size_bytes: int
+
+
+@router.get("", response_model=list[ProfileSummary])
+async def get_profiles():
+    return [
+        ProfileSummary(
+            id=d.id,
+            method=d.method,
+            path=d.path,
+            status_code=d.status_code,
+            duration_ms=d.duration_ms,
+            captured_at=d.captured_at,
+            size_bytes=len(d.data),
+        )
+        for d in list_dumps()
+    ]
+
+
+@router.get("/{dump_id}")
+async def download_profile(dump_id: int):
+    """Download a dump; open with ``python -m pstats`` or snakeviz."""
+    dump = get_dump(dump_id)
+    if dump is None:
+        raise HTTPException(status_code=404)
+    return Response(
+        dump.data,
+        media_type="application/octet-stream",
+        headers={
+            "Content-Disposition": f'attachment; filename="profile-{dump.id}.prof"',
+        },
+    )
@@ -14,5 +14,24 @@ class Settings(BaseSettings):
 
     DEBUG: bool = True
 
+    # Structured access log (see app/access_log.py). Successful /static hits
+    # are logged with this probability; everything else is always logged.
+    ACCESS_LOG_ENABLED: bool = True
+    ACCESS_LOG_STATIC_SAMPLE_RATE: float = 0.1
+    ACCESS_LOG_BATCH_SIZE: int = 100
+    ACCESS_LOG_FLUSH_INTERVAL: float = 1.0
+
+    # Request profiling (see app/profiling.py). An empty token disables
+    # profiling entirely (including sampling) and the admin endpoints.
+    PROFILE_TOKEN: str = ""
+    PROFILE_SAMPLE_RATE: float = 0.0
+    PROFILE_BUFFER_SIZE: int = 20
+
+    # Admission control for /api/download-cv (see app/rate_limit.py)
+    CV_RATE_LIMIT_PER_MINUTE: float = 6.0
+    CV_RATE_LIMIT_BURST: int = 3
+    CV_MAX_CONCURRENT: int = 2
+    RATE_LIMIT_MAX_CLIENTS: int = 10_000
+
 
 settings = Settings()
@@ -1,8 +1,10 @@
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 
+from app.access_log import AccessLogMiddleware, access_log_writer
 from app.config import settings, BASE_DIR
 from app.pages.router import router as pages_router
 from app.api.profile import router as profile_router
@@ -14,9 +16,26 @@ from app.api.services import router as services_router
 from app.api.contact import router as contact_router
 from app.api.about import router as about_router
 from app.api.cv import router as cv_router
+from app.api.content_version import router as content_version_router
 from app.api.health import router as health_router
+from app.api.profiles import router as profiles_router
+from app.profiling import profile_requests
 
-app = FastAPI(title="freelanxur", debug=settings.DEBUG)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.ACCESS_LOG_ENABLED:
+        access_log_writer.start()
+    yield
+    access_log_writer.stop()
+
+
+app = FastAPI(title="freelanxur", debug=settings.DEBUG, lifespan=lifespan)
+if settings.PROFILE_TOKEN:
+    # Without a token no dump could be downloaded, so skip the per-request cost.
+    app.middleware("http")(profile_requests)
+if settings.ACCESS_LOG_ENABLED:
+    app.add_middleware(AccessLogMiddleware)
 
 static_dir = BASE_DIR / "static"
 if static_dir.exists():
@@ -32,7 +51,9 @@ app.include_router(services_router)
 app.include_router(contact_router)
 app.include_router(about_router)
 app.include_router(cv_router)
+app.include_router(content_version_router)
 app.include_router(health_router)
+app.include_router(profiles_router)
 
 # Page router (must be last — catches /)
 app.include_router(pages_router)
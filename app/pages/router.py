@@ -3,6 +3,7 @@ import time
 from fastapi import APIRouter, Request
 from fastapi.templating import Jinja2Templates
 
+from app.api.content import content_version
 from app.config import BASE_DIR
 
 router = APIRouter(include_in_schema=False)
@@ -11,9 +12,26 @@ templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
 # Cache-bust static assets on each deploy
 _ASSET_VERSION = str(int(time.time()))
 
+# Above-the-fold CSS produced by scripts/build_css.py. When the build has not
+# been run (e.g. local dev), the page falls back to the full stylesheet.
+_CRITICAL_CSS_PATH = BASE_DIR / "static" / "css" / "dist" / "critical.css"
+_CRITICAL_CSS = (
+    _CRITICAL_CSS_PATH.read_text(encoding="utf-8")
+    if _CRITICAL_CSS_PATH.exists()
+    else None
+)
+
 
 @router.get("/")
 async def index(request: Request):
+    version = content_version()
     return templates.TemplateResponse(
-        "index.html", {"request": request, "v": _ASSET_VERSION}
+        "index.html",
+        {
+            "request": request,
+            "v": _ASSET_VERSION,
+            "critical_css": _CRITICAL_CSS,
+            "content_version": version,
+        },
+        headers={"X-Content-Version": version},
     )
@@ -0,0 +1,102 @@
+"""Opt-in per-request cProfile capture, kept in a bounded in-memory ring buffer.
+
+A request is profiled when it carries ``X-Profile-Token`` matching
+``settings.PROFILE_TOKEN``, or when it is picked by ``PROFILE_SAMPLE_RATE``.
+Dumps are ``pstats``-compatible and can be downloaded from the admin
+endpoints in ``app/api/profiles.py``.
+"""
+
+import cProfile
+import hmac
+import itertools
+import marshal
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from fastapi import Request
+
+from app.config import settings
+
+PROFILE_HEADER = "X-Profile-Token"
+
+
+@dataclass(frozen=True)
+class ProfileDump:
+    id: int
+    method: str
+    path: str
+    status_code: int
+    duration_ms: float
+    captured_at: datetime
+    data: bytes
+
+
+_dumps: deque[ProfileDump] = deque(maxlen=settings.PROFILE_BUFFER_SIZE)
+_ids = itertools.count(1)
+
+# On Python 3.12+ cProfile hooks sys.monitoring, which is interpreter-wide:
+# only one profiler may run at a time, and it also sees threadpool work such
+# as the sync CV endpoint. Requests arriving while one is active go unprofiled.
+_active = threading.Lock()
+
+
+def token_matches(token: str | None) -> bool:
+    # Compare bytes: compare_digest rejects non-ASCII str, and Starlette
+    # decodes header values as latin-1.
+    return bool(settings.PROFILE_TOKEN) and hmac.compare_digest(
+        (token or "").encode("utf-8"), settings.PROFILE_TOKEN.encode("utf-8")
+    )
+
+
+def _should_profile(request: Request) -> bool:
+    # Never profile the admin endpoints themselves: listing or downloading
+    # would otherwise push the dump being inspected out of the ring buffer.
+    if request.url.path.startswith(("/static", "/api/admin")):
+        return False
+    if token_matches(request.headers.get(PROFILE_HEADER)):
+        return True
+    return random.random() < settings.PROFILE_SAMPLE_RATE
+
+
+def list_dumps() -> list[ProfileDump]:
+    """Return captured dumps, newest first."""
+    return list(reversed(_dumps))
+
+
+def get_dump(dump_id: int) -> ProfileDump | None:
+    return next((d for d in _dumps if d.id == dump_id), None)
+
+
+async def profile_requests(request: Request, call_next):
+    """HTTP middleware: profile the selected request, otherwise pass through."""
+    if not _should_profile(request) or not _active.acquire(blocking=False):
+        return await call_next(request)
+
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    try:
+        profiler.enable()
+        try:
+            response = await call_next(request)
+        finally:
+            profiler.disable()
+    finally:
+        _active.release()
+
+    profiler.create_stats()
+    _dumps.append(
+        ProfileDump(
+            id=next(_ids),
+            method=request.method,
+            path=request.url.path,
+            status_code=response.status_code,
+            duration_ms=round((time.perf_counter() - start) * 1000, 2),
+            captured_at=datetime.now(timezone.utc),
+            data=marshal.dumps(profiler.stats),
+        )
+    )
+    return response
@@ -0,0 +1,99 @@
+"""In-process rate limiting and admission control for expensive routes.
+
+Each ``RateLimiter`` combines a per-client token bucket (clients keyed by IP,
+held in an LRU-bounded table so memory stays flat under many distinct
+clients) with a global cap on concurrent requests. Use an instance as a
+router or route dependency.
+"""
+
+import math
+import time
+from collections import OrderedDict
+
+from fastapi import HTTPException, Request
+
+from app.config import settings
+
+
+class _Bucket:
+    __slots__ = ("tokens", "updated")
+
+    def __init__(self, tokens: float, updated: float):
+        self.tokens = tokens
+        self.updated = updated
+
+
+def client_ip(request: Request) -> str:
+    """Return the peer address.
+
+    ``X-Forwarded-For`` is deliberately not read here: uvicorn rewrites the
+    peer address from it only for proxies listed in ``--forwarded-allow-ips``
+    (``FORWARDED_ALLOW_IPS``), so clients cannot pick their own bucket.
+    """
+    return request.client.host if request.client else "unknown"
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        per_minute: float,
+        burst: int,
+        max_concurrent: int,
+        max_clients: int,
+    ):
+        self.rate = per_minute / 60
+        self.burst = burst
+        self.max_concurrent = max_concurrent
+        self.max_clients = max_clients
+        self.in_flight = 0
+        self._buckets: OrderedDict[str, _Bucket] = OrderedDict()
+
+    def take(self, key: str, now: float | None = None) -> float:
+        """Consume a token for *key*; return 0 if allowed, else seconds to wait."""
+        now = time.monotonic() if now is None else now
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = _Bucket(self.burst, now)
+            self._buckets[key] = bucket
+            if len(self._buckets) > self.max_clients:
+                # Evicted clients simply start again with a full bucket.
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+            elapsed = now - bucket.updated
+            bucket.tokens = min(self.burst, bucket.tokens + elapsed * self.rate)
+            bucket.updated = now
+
+        if bucket.tokens >= 1:
+            bucket.tokens -= 1
+            return 0.0
+        return (1 - bucket.tokens) / self.rate
+
+    async def __call__(self, request: Request):
+        if self.in_flight >= self.max_concurrent:
+            raise HTTPException(
+                status_code=503,
+                detail="Server busy",
+                headers={"Retry-After": "5"},
+            )
+        retry_after = self.take(client_ip(request))
+        if retry_after:
+            raise HTTPException(
+                status_code=429,
+                detail="Too many requests",
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
+
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+
+
+cv_rate_limit = RateLimiter(
+    per_minute=settings.CV_RATE_LIMIT_PER_MINUTE,
+    burst=settings.CV_RATE_LIMIT_BURST,
+    max_concurrent=settings.CV_MAX_CONCURRENT,
+    max_clients=settings.RATE_LIMIT_MAX_CLIENTS,
+)
@@ -0,0 +1,56 @@
+"""Benchmark RateLimiter memory and per-call overhead with many distinct clients.
+
+Usage::
+
+    uv run python scripts/bench_rate_limit.py [clients]
+"""
+
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.config import settings  # noqa: E402
+from app.rate_limit import RateLimiter  # noqa: E402
+
+
+def bench(clients: int, max_clients: int) -> None:
+    limiter = RateLimiter(
+        per_minute=settings.CV_RATE_LIMIT_PER_MINUTE,
+        burst=settings.CV_RATE_LIMIT_BURST,
+        max_concurrent=settings.CV_MAX_CONCURRENT,
+        max_clients=max_clients,
+    )
+    keys = [f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}" for i in range(clients)]
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    for key in keys:
+        limiter.take(key)
+    fresh = time.perf_counter() - start
+    table_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Repeat hits on a warm, full table (bucket refill + LRU reorder).
+    hot = keys[-min(clients, max_clients):]
+    start = time.perf_counter()
+    for key in hot:
+        limiter.take(key)
+    repeat = time.perf_counter() - start
+
+    print(
+        f"{clients:>9,} clients  cap {max_clients:>7,}  "
+        f"table {len(limiter._buckets):>7,}  "
+        f"mem {table_bytes / 1024 / 1024:6.2f} MiB  "
+        f"new {fresh / clients * 1e6:5.2f} us/call  "
+        f"repeat {repeat / len(hot) * 1e6:5.2f} us/call"
+    )
+
+
+if __name__ == "__main__":
+    clients = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    for n in (1_000, 100_000, clients):
+        bench(n, settings.RATE_LIMIT_MAX_CLIENTS)
+    bench(clients, clients)
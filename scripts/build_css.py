@@ -0,0 +1,254 @@
+"""Build the critical (inlined) and deferred stylesheets for index.html.
+
+Reads ``static/css/style.css`` and writes two files to ``static/css/dist/``:
+
+* ``style.css``    -- the full stylesheet minus selectors that neither
+                      ``templates/index.html`` nor ``static/js/main.js``
+                      reference. Loaded asynchronously by the page.
+* ``critical.css`` -- the subset of ``style.css`` needed to paint the first
+                      viewport (loader, navbar, hero). Inlined into the page
+                      by ``app/pages/router.py`` when present.
+
+Usage::
+
+    uv run python scripts/build_css.py
+"""
+
+import gzip
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+SOURCE_CSS = BASE_DIR / "static" / "css" / "style.css"
+TEMPLATE = BASE_DIR / "templates" / "index.html"
+MAIN_JS = BASE_DIR / "static" / "js" / "main.js"
+DIST_DIR = BASE_DIR / "static" / "css" / "dist"
+
+# Everything in the template before this marker is above the fold.
+FOLD_MARKER = '<section id="metrics"'
+
+# Hero markup and state classes that main.js renders into the first viewport.
+# Keep in sync with renderHero() and the loader/navbar code in main.js.
+ABOVE_FOLD_JS_CLASSES = {
+    "active", "available", "fade-out", "hero-glow", "hero-greeting",
+    "hero-name", "hero-parallax", "hero-stagger", "hero-tagline",
+    "hero-title", "hero-title-slot", "logo-img", "nav-links-indicator",
+    "scrolled", "status-badge", "status-dot", "title-text", "typing-text",
+    "unavailable", "visible",
+}
+
+# Keyframes main.js applies to hero elements via inline styles.
+ABOVE_FOLD_JS_ANIMATIONS = {"typing", "blink"}
+
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_WORD_RE = re.compile(r"[A-Za-z_][\w-]*")
+_CLASS_OR_ID_RE = re.compile(r"[.#](-?[A-Za-z_][\w-]*)")
+# Attribute selectors and pseudo-class arguments never name a class or id.
+_SELECTOR_NOISE_RE = re.compile(r"\[[^\]]*\]|\([^)]*\)")
+_ANIMATION_RE = re.compile(r"animation(?:-name)?\s*:\s*([^;}]+)")
+
+
+# ── Parsing ───────────────────────────────────────────────────────────────────
+
+@dataclass
+class Rule:
+    """A qualified rule (``prelude { declarations }``) or leaf at-rule."""
+
+    prelude: str
+    body: str
+
+    def render(self) -> str:
+        return f"{self.prelude}{{{self.body}}}"
+
+
+@dataclass
+class Group:
+    """A conditional group rule (``@media``/``@supports``) holding child rules."""
+
+    prelude: str
+    children: list[Rule] = field(default_factory=list)
+
+    def render(self) -> str:
+        inner = "".join(child.render() for child in self.children)
+        return f"{self.prelude}{{{inner}}}"
+
+
+def _minify(text: str) -> str:
+    text = re.sub(r"\s+", " ", text).strip()
+    text = re.sub(r"\s*([{};,>])\s*", r"\1", text)
+    text = re.sub(r"\s*:\s*", ":", text)
+    return text.replace(";}", "}").rstrip(";")
+
+
+def _minify_prelude(prelude: str) -> str:
+    prelude = re.sub(r"\s+", " ", prelude).strip()
+    # Keep the space in "@media (x)" and descendant combinators intact.
+    return re.sub(r"\s*([,>])\s*", r"\1", prelude)
+
+
+def parse(css: str) -> list[Rule | Group]:
+    """Split *css* into top-level rules, descending one level into groups."""
+    css = _COMMENT_RE.sub("", css)
+    nodes: list[Rule | Group] = []
+    pos = 0
+    while True:
+        brace = css.find("{", pos)
+        if brace == -1:
+            break
+        prelude = css[pos:brace].strip()
+        depth, end = 1, brace + 1
+        while depth:
+            if css[end] == "{":
+                depth += 1
+            elif css[end] == "}":
+                depth -= 1
+            end += 1
+        body = css[brace + 1:end - 1]
+        if prelude.startswith(("@media", "@supports")):
+            children = [node for node in parse(body) if isinstance(node, Rule)]
+            nodes.append(Group(_minify_prelude(prelude), children))
+        elif prelude.startswith("@"):
+            # @keyframes and friends: keep the block verbatim (minified).
+            nodes.append(Rule(_minify_prelude(prelude), _minify(body)))
+        else:
+            nodes.append(Rule(_minify_prelude(prelude), _minify(body)))
+        pos = end
+    return nodes
+
+
+def _selector_names(selector: str) -> set[str]:
+    return set(_CLASS_OR_ID_RE.findall(_SELECTOR_NOISE_RE.sub("", selector)))
+
+
+def _keyframes_name(rule: Rule) -> str | None:
+    if rule.prelude.startswith(("@keyframes", "@-webkit-keyframes")):
+        return rule.prelude.split(None, 1)[1].strip()
+    return None
+
+
+def _animation_names(nodes: list[Rule | Group]) -> set[str]:
+    names: set[str] = set()
+    for node in nodes:
+        rules = node.children if isinstance(node, Group) else [node]
+        for rule in rules:
+            for value in _ANIMATION_RE.findall(rule.body):
+                names.update(_WORD_RE.findall(value))
+    return names
+
+
+# ── Selection ─────────────────────────────────────────────────────────────────
+
+def _filter(
+    nodes: list[Rule | Group],
+    keep_selector,
+    extra_animations: set[str],
+) -> list[Rule | Group]:
+    """Keep selectors accepted by *keep_selector*; drop emptied rules/groups.
+
+    Keyframes survive only if a surviving rule (or *extra_animations*)
+    references them.
+    """
+    out: list[Rule | Group] = []
+    for node in nodes:
+        if isinstance(node, Group):
+            children = _filter(node.children, keep_selector, extra_animations)
+            if children:
+                out.append(Group(node.prelude, children))
+        elif node.prelude.startswith("@"):
+            out.append(node)
+        else:
+            selectors = [s for s in node.prelude.split(",") if keep_selector(s)]
+            if selectors:
+                out.append(Rule(",".join(selectors), node.body))
+
+    used = _animation_names(out) | extra_animations
+    return [
+        node for node in out
+        if not isinstance(node, Rule)
+        or (name := _keyframes_name(node)) is None
+        or name in used
+    ]
+
+
+def purge(nodes: list[Rule | Group], used_words: set[str]) -> list[Rule | Group]:
+    """Drop selectors naming a class or id that never appears in *used_words*."""
+    return _filter(
+        nodes,
+        lambda selector: _selector_names(selector) <= used_words,
+        extra_animations=used_words,
+    )
+
+
+def critical(nodes: list[Rule | Group], fold_names: set[str]) -> list[Rule | Group]:
+    """Keep global rules and rules that only target above-the-fold elements."""
+    return _filter(
+        nodes,
+        lambda selector: _selector_names(selector) <= fold_names,
+        extra_animations=ABOVE_FOLD_JS_ANIMATIONS,
+    )
+
+
+def render(nodes: list[Rule | Group]) -> str:
+    return "".join(node.render() for node in nodes) + "\n"
+
+
+# ── Reporting ─────────────────────────────────────────────────────────────────
+
+def _size(text: str) -> str:
+    raw = len(text.encode("utf-8"))
+    zipped = len(gzip.compress(text.encode("utf-8")))
+    return f"{raw / 1024:7.1f} KiB ({zipped / 1024:5.1f} KiB gzip)"
+
+
+def _count_selectors(nodes: list[Rule | Group]) -> int:
+    count = 0
+    for node in nodes:
+        rules = node.children if isinstance(node, Group) else [node]
+        count += sum(
+            len(rule.prelude.split(","))
+            for rule in rules
+            if not rule.prelude.startswith("@")
+        )
+    return count
+
+
+def main() -> None:
+    source = SOURCE_CSS.read_text(encoding="utf-8")
+    template = TEMPLATE.read_text(encoding="utf-8")
+    script = MAIN_JS.read_text(encoding="utf-8")
+
+    used_words = set(_WORD_RE.findall(template)) | set(_WORD_RE.findall(script))
+    if FOLD_MARKER not in template:
+        # Without the marker every rule would silently become critical.
+        raise SystemExit(
+            f"build_css: fold marker {FOLD_MARKER!r} not found in {TEMPLATE}; "
+            "update FOLD_MARKER to match the first below-the-fold section."
+        )
+    fold_markup = template.split(FOLD_MARKER, 1)[0]
+    fold_names = (set(_WORD_RE.findall(fold_markup)) | ABOVE_FOLD_JS_CLASSES) & used_words
+
+    nodes = parse(source)
+    purged = purge(nodes, used_words)
+    above_fold = critical(purged, fold_names)
+
+    minified_css = render(nodes)
+    purged_css = render(purged)
+    critical_css = render(above_fold)
+
+    DIST_DIR.mkdir(parents=True, exist_ok=True)
+    (DIST_DIR / "style.css").write_text(purged_css, encoding="utf-8")
+    (DIST_DIR / "critical.css").write_text(critical_css, encoding="utf-8")
+
+    print(f"source   style.css    {_size(source)}  {_count_selectors(nodes)} selectors")
+    print(f"minified              {_size(minified_css)}  {_count_selectors(nodes)} selectors")
+    print(f"+purged  style.css    {_size(purged_css)}  {_count_selectors(purged)} selectors")
+    print(f"inlined  critical.css {_size(critical_css)}  {_count_selectors(above_fold)} selectors")
+    print(
+        "render-blocking CSS: "
+        f"{_size(source).strip()} -> {_size(critical_css).strip()} (inline, no request)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -433,9 +433,68 @@
 
     async function fetchJSON(url) {
         var res = await fetch(url);
+        if (!res.ok) {
+            throw new Error(url + ' returned ' + res.status);
+        }
         return res.json();
     }
 
+    /* Section payloads are cached in localStorage, keyed by the server's
+       content version, so repeat visits skip every data fetch. The version
+       also hashes this file and app/api, so code changes invalidate it. */
+    var CONTENT_CACHE_KEY = 'contentCache:v1';
+    var CONTENT_URLS = [
+        '/api/profile',
+        '/api/metrics',
+        '/api/about',
+        '/api/skills',
+        '/api/services',
+        '/api/projects',
+        '/api/experience',
+        '/api/contact'
+    ];
+
+    async function getContentVersion() {
+        var meta = document.querySelector('meta[name="content-version"]');
+        if (meta && meta.content) return meta.content;
+        var res = await fetchJSON('/api/content-version');
+        return res.version;
+    }
+
+    function readContentCache(version) {
+        try {
+            var cached = JSON.parse(localStorage.getItem(CONTENT_CACHE_KEY));
+            if (cached && cached.version === version) return cached.data;
+        } catch (err) {
+            // Corrupt or unavailable storage -- fall through to the network
+        }
+        return null;
+    }
+
+    function writeContentCache(version, data) {
+        try {
+            localStorage.setItem(CONTENT_CACHE_KEY, JSON.stringify({ version: version, data: data }));
+        } catch (err) {
+            // Quota exceeded or storage disabled -- caching is best-effort
+        }
+    }
+
+    async function loadContent() {
+        var version = null;
+        try {
+            version = await getContentVersion();
+        } catch (err) {
+            console.warn('Content version unavailable, skipping cache:', err);
+        }
+
+        var cached = version ? readContentCache(version) : null;
+        if (cached) return cached;
+
+        var data = await Promise.all(CONTENT_URLS.map(fetchJSON));
+        if (version) writeContentCache(version, data);
+        return data;
+    }
+
     /* ----------------------------------------------------------------------
        4. SVG ICON MAP
        ---------------------------------------------------------------------- */
@@ -521,6 +580,8 @@
        8. SECTION RENDERERS
        ---------------------------------------------------------------------- */
 
+    // Classes rendered here are above the fold: keep them listed in
+    // ABOVE_FOLD_JS_CLASSES in scripts/build_css.py so they are inlined.
     function renderHero(profile) {
         var container = document.getElementById('hero-content');
         if (!container) return;
@@ -1000,17 +1061,8 @@
     // Theme must apply before loader (so loader has correct bg)
     applyTheme(getTheme());
 
-    // Start fetching data immediately (in parallel with loader animation)
-    var dataPromise = Promise.all([
-        fetchJSON('/api/profile'),
-        fetchJSON('/api/metrics'),
-        fetchJSON('/api/about'),
-        fetchJSON('/api/skills'),
-        fetchJSON('/api/services'),
-        fetchJSON('/api/projects'),
-        fetchJSON('/api/experience'),
-        fetchJSON('/api/contact')
-    ]);
+    // Start loading data immediately (in parallel with loader animation)
+    var dataPromise = loadContent();
 
     runPageLoader(function () {
         init(dataPromise);
@@ -0,0 +1,15 @@
+import os
+
+# Settings are read at import time, so enable profiling before the app loads.
+os.environ.setdefault("PROFILE_TOKEN", "test-token")
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.main import app  # noqa: E402
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as client:
+        yield client
@@ -0,0 +1,78 @@
+import asyncio
+import io
+import json
+
+from app.access_log import AccessLogMiddleware, AccessLogWriter
+from app.api.content import content_version
+from app.config import settings
+
+
+def read_lines(stream):
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+async def respond_with_path_status(scope, receive, send):
+    """Tiny ASGI app: /static/ok -> 200, /static/missing -> 404, else 500."""
+    status = {"/static/ok": 200, "/static/missing": 404}.get(scope["path"], 500)
+    await send({"type": "http.response.start", "status": status, "headers": []})
+    await send({"type": "http.response.body", "body": b"body"})
+
+
+def request(middleware, path):
+    scope = {"type": "http", "method": "GET", "path": path}
+
+    async def receive():
+        return {"type": "http.request"}
+
+    async def send(message):
+        pass
+
+    asyncio.run(middleware(scope, receive, send))
+
+
+def test_stop_flushes_queued_records():
+    stream = io.StringIO()
+    writer = AccessLogWriter(stream=stream, batch_size=2, flush_interval=60)
+    writer.start()
+    for i in range(5):
+        writer.emit({"n": i})
+    writer.stop()
+
+    assert [r["n"] for r in read_lines(stream)] == [0, 1, 2, 3, 4]
+
+
+def test_static_success_is_sampled_but_errors_are_always_logged(monkeypatch):
+    monkeypatch.setattr(settings, "ACCESS_LOG_STATIC_SAMPLE_RATE", 0.0)
+    stream = io.StringIO()
+    writer = AccessLogWriter(stream=stream)
+    middleware = AccessLogMiddleware(respond_with_path_status, writer=writer)
+
+    writer.start()
+    for path in ("/static/ok", "/static/missing", "/api/broken"):
+        request(middleware, path)
+    writer.stop()
+
+    records = read_lines(stream)
+    assert [(r["path"], r["status"]) for r in records] == [
+        ("/static/missing", 404),
+        ("/api/broken", 500),
+    ]
+    assert records[0]["bytes"] == 4
+    assert records[0]["cache"] == "miss"
+    assert records[1]["cache"] is None
+    assert all(r["content_version"] == content_version() for r in records)
+
+
+def test_full_queue_drops_and_reports():
+    stream = io.StringIO()
+    writer = AccessLogWriter(stream=stream, max_queue=2)
+    for i in range(5):
+        writer.emit({"n": i})
+    assert writer.dropped == 3
+
+    writer.start()
+    writer.stop()
+
+    records = read_lines(stream)
+    assert [r["n"] for r in records if "n" in r] == [0, 1]
+    assert [r["dropped"] for r in records if "dropped" in r] == [3]
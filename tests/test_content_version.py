@@ -0,0 +1,63 @@
+import re
+import shutil
+
+from app.api.content import content_version
+
+
+def test_content_version_endpoint(client):
+    response = client.get("/api/content-version")
+
+    assert response.status_code == 200
+    assert response.json() == {"version": content_version()}
+    assert response.headers["x-content-version"] == content_version()
+    assert response.headers["cache-control"] == "no-cache"
+
+
+def test_index_embeds_content_version(client):
+    response = client.get("/")
+
+    assert response.headers["x-content-version"] == content_version()
+    meta = re.search(
+        r'<meta name="content-version" content="([0-9a-f]+)">', response.text
+    )
+    assert meta is not None
+    assert meta.group(1) == content_version()
+
+
+def _flip_first_byte(path):
+    data = bytearray(path.read_bytes())
+    data[0] ^= 1
+    path.write_bytes(bytes(data))
+
+
+def test_content_version_tracks_content_and_code_bytes(monkeypatch, tmp_path):
+    import app.api.content as content
+
+    content_dir = tmp_path / "content"
+    shutil.copytree(content.CONTENT_DIR, content_dir)
+    main_js = tmp_path / "static" / "js" / "main.js"
+    main_js.parent.mkdir(parents=True)
+    shutil.copy(content.BASE_DIR / "static" / "js" / "main.js", main_js)
+
+    monkeypatch.setattr(content, "BASE_DIR", tmp_path)
+    monkeypatch.setattr(content, "CONTENT_DIR", content_dir)
+    monkeypatch.setattr(content, "_PAYLOAD_CODE", [main_js])
+
+    def fresh_version():
+        content_version.cache_clear()
+        return content_version()
+
+    try:
+        baseline = fresh_version()
+        assert fresh_version() == baseline
+
+        profile = content_dir / "profile.json"
+        _flip_first_byte(profile)
+        assert fresh_version() != baseline
+        _flip_first_byte(profile)
+        assert fresh_version() == baseline
+
+        _flip_first_byte(main_js)
+        assert fresh_version() != baseline
+    finally:
+        content_version.cache_clear()
@@ -0,0 +1,36 @@
+from app.profiling import PROFILE_HEADER, list_dumps
+
+TOKEN = {PROFILE_HEADER: "test-token"}
+
+
+def test_token_header_captures_dump(client):
+    before = len(list_dumps())
+    client.get("/api/profile", headers=TOKEN)
+
+    dumps = list_dumps()
+    assert len(dumps) == before + 1
+    assert dumps[0].path == "/api/profile"
+
+
+def test_admin_endpoints_are_not_profiled(client):
+    client.get("/api/profile", headers=TOKEN)
+    newest = list_dumps()[0].id
+
+    for _ in range(3):
+        response = client.get("/api/admin/profiles", headers=TOKEN)
+        assert response.status_code == 200
+    client.get(f"/api/admin/profiles/{newest}", headers=TOKEN)
+
+    assert list_dumps()[0].id == newest
+    assert all(not d.path.startswith("/api/admin") for d in list_dumps())
+
+
+def test_admin_requires_token(client):
+    assert client.get("/api/admin/profiles").status_code == 403
+
+
+def test_non_ascii_token_is_rejected(client):
+    headers = [(PROFILE_HEADER.encode(), "café".encode("latin-1"))]
+
+    assert client.get("/api/profile", headers=headers).status_code == 200
+    assert client.get("/api/admin/profiles", headers=headers).status_code == 403
@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app.rate_limit import RateLimiter, cv_rate_limit
+
+
+def make_limiter(**overrides):
+    options = dict(per_minute=6, burst=3, max_concurrent=2, max_clients=100)
+    options.update(overrides)
+    return RateLimiter(**options)
+
+
+def make_request(host="10.0.0.1", forwarded=None):
+    headers = [(b"x-forwarded-for", forwarded.encode())] if forwarded else []
+    return Request({"type": "http", "client": (host, 1234), "headers": headers})
+
+
+def enter(limiter, request):
+    """Run the dependency up to its yield; return the generator to close later."""
+    dependency = limiter(request)
+    asyncio.run(dependency.__anext__())
+    return dependency
+
+
+def test_burst_then_retry_after():
+    limiter = make_limiter()
+
+    assert [limiter.take("a", now=0.0) for _ in range(3)] == [0.0, 0.0, 0.0]
+    # 6/min refills one token every 10 seconds.
+    assert limiter.take("a", now=0.0) == pytest.approx(10.0)
+
+    with pytest.raises(HTTPException) as exc:
+        for _ in range(4):
+            enter(limiter, make_request())
+    assert exc.value.status_code == 429
+    assert exc.value.headers["Retry-After"] == "10"
+
+
+def test_tokens_refill_at_per_minute_rate():
+    limiter = make_limiter()
+    for _ in range(3):
+        limiter.take("a", now=0.0)
+
+    assert limiter.take("a", now=5.0) == pytest.approx(5.0)
+    assert limiter.take("a", now=10.0) == 0.0
+    assert limiter.take("a", now=10.0) > 0
+    # Refill is capped at the burst size.
+    assert [limiter.take("a", now=1000.0) for _ in range(4)][-1] > 0
+
+
+def test_bucket_table_is_lru_bounded():
+    limiter = make_limiter(max_clients=3)
+    for key in ("a", "b", "c"):
+        limiter.take(key, now=0.0)
+    limiter.take("a", now=1.0)  # refresh "a" so "b" is now oldest
+    limiter.take("d", now=2.0)
+
+    assert len(limiter._buckets) == 3
+    assert list(limiter._buckets) == ["c", "a", "d"]
+
+
+def test_busy_rejection_does_not_spend_a_token():
+    limiter = make_limiter(max_concurrent=1)
+    held = enter(limiter, make_request(host="10.0.0.2"))
+
+    with pytest.raises(HTTPException) as exc:
+        enter(limiter, make_request())
+    assert exc.value.status_code == 503
+    assert "10.0.0.1" not in limiter._buckets
+
+    asyncio.run(held.aclose())
+    assert limiter.in_flight == 0
+
+
+def test_forwarded_header_is_not_trusted():
+    limiter = make_limiter()
+    for i in range(3):
+        asyncio.run(enter(limiter, make_request(forwarded=f"1.1.1.{i}")).aclose())
+
+    assert list(limiter._buckets) == ["10.0.0.1"]
+
+
+def test_in_flight_returns_to_zero_after_request(client):
+    assert client.get("/api/download-cv").status_code == 200
+    assert cv_rate_limit.in_flight == 0